@@ -1,21 +1,29 @@
 import sqlite3
 import json
+from contextlib import closing
 
-con = sqlite3.connect('metrics.db')
-cur = con.cursor()
 
-# Create table - this is an example, you should create a table called metrics or similar
-# cur.execute('''CREATE TABLE stocks
-#               (date text, trans text, symbol text, qty real, price real)''')
+def main():
+    with closing(sqlite3.connect('metrics.db')) as con:
+        cur = con.cursor()
 
-# Insert a row of data - again, just for illustration
-# cur.execute("INSERT INTO stocks VALUES ('2006-01-05','BUY','RHAT',100,35.14)")
+        # Create table - this is an example, you should create a table called metrics or similar
+        # cur.execute('''CREATE TABLE stocks
+        #               (date text, trans text, symbol text, qty real, price real)''')
 
-# Save (commit) the changes
-# con.commit()
+        # Insert a row of data - again, just for illustration
+        # cur.execute("INSERT INTO stocks VALUES ('2006-01-05','BUY','RHAT',100,35.14)")
 
-# Read the WAL records
-with open("./wal.json", "r") as f:
-    records = json.loads(f.read())
+        # Save (commit) the changes
+        # con.commit()
 
-# Add code here
+        # Read the WAL records
+        with open("./wal.json", "r") as f:
+            records = json.loads(f.read())
+
+        # Add code here
+
+
+# Only touch the database when run as a script, so importing this module does no IO
+if __name__ == "__main__":
+    main()